@@ -1,28 +1,142 @@
 import os
+import re
 import json
+import hashlib
+from html import escape
+from urllib.parse import quote, unquote
+
+try:
+    from PIL import Image, ImageOps  # pip install Pillow (optional: enables resized variants)
+except ImportError:
+    Image = None
+
+EXIF_ORIENTATION = 0x0112
+ROTATED_ORIENTATIONS = {5, 6, 7, 8}  # EXIF orientations that swap width and height
 
 # Folders and output
 IMAGE_FOLDER = "images/binder"
 OUTPUT_FILE = "binder.html"
-
-# Grab images
-images = sorted([
-    f for f in os.listdir(IMAGE_FOLDER)
-    if f.lower().endswith((".png", ".jpg", ".jpeg", ".gif", ".webp"))
-])
-
-if not images:
-    print("No images found in folder.")
-    exit()
-
-html = f"""<!DOCTYPE html>
+HEADERS_FILE = "_headers"  # static-host cache rules, written next to the output file
+DATA_SUFFIX = ".images.json"  # image list, written next to the output file
+VARIANT_SUBFOLDER = "sized"
+
+VARIANT_WIDTHS = (600, 1100, 2200)
+VARIANT_QUALITY = 82
+PAGE_SIZES = "(max-width: 600px) 45vw, 550px"  # one page is half the 90%/1100px binder
+JSON_SEPARATORS = (",", ":")  # compact arrays in the emitted <script>
+
+IMAGE_EXTS = {".png", ".jpg", ".jpeg", ".gif", ".webp"}
+
+
+# ---------------- Helpers ----------------
+
+def scan_images(image_folder):
+    with os.scandir(image_folder) as it:
+        return sorted(
+            e.name for e in it
+            if e.is_file(follow_symlinks=False) and os.path.splitext(e.name)[1].lower() in IMAGE_EXTS
+        )
+
+
+# Version each image URL by mtime/size so the server can cache it forever
+def image_version(image_folder, name):
+    st = os.stat(os.path.join(image_folder, name))
+    return hashlib.md5(f"{st.st_mtime_ns}-{st.st_size}".encode()).hexdigest()[:10]
+
+
+# The one place image URLs are built, so src, srcset and preload links always match
+def image_url(folder, name, version):
+    return quote(folder + "/" + name) + "?v=" + version
+
+
+# Fingerprint of the inputs; an unchanged fingerprint means the last build is still valid.
+# Covers this script itself, the settings and Pillow's availability, not just the images.
+def build_signature(image_folder, images):
+    with open(__file__, "rb") as f:
+        h = hashlib.blake2b(f.read())
+    settings = (image_folder, VARIANT_WIDTHS, VARIANT_QUALITY, PAGE_SIZES, Image is not None)
+    h.update(repr(settings).encode())
+    for name in images:
+        st = os.stat(os.path.join(image_folder, name))
+        h.update(f"{name}\0{st.st_mtime_ns}\0{st.st_size}\n".encode())
+    return h.hexdigest()[:32]
+
+
+def is_up_to_date(output_file, data_path, signature):
+    if not (os.path.exists(output_file) and os.path.exists(data_path)):
+        return False
+    with open(output_file, encoding="utf-8") as f:
+        if f"<!--sig:{signature}-->" not in f.read(200):
+            return False
+
+    # Every file the srcsets point at must still exist (e.g. sized/ was deleted)
+    try:
+        with open(data_path, encoding="utf-8") as f:
+            srcsets = json.load(f)["srcsets"]
+    except (OSError, ValueError, KeyError):
+        return False
+    for srcset in srcsets:
+        for candidate in filter(None, srcset.split(", ")):
+            url = candidate.rsplit(" ", 1)[0].split("?", 1)[0]
+            if not os.path.exists(unquote(url)):
+                return False
+    return True
+
+
+# Downscaled WebP copies so phones don't pull full-resolution scans
+def make_variants(image_folder, name, version):
+    if Image is None:
+        return ""
+
+    variant_folder = f"{image_folder}/{VARIANT_SUBFOLDER}"
+    src_path = os.path.join(image_folder, name)
+    stem = os.path.splitext(name)[0]
+    entries = []
+    try:
+        with Image.open(src_path) as im:
+            # WebP variants carry no EXIF, so bake the orientation in; sizes are the upright ones.
+            # Reading the tag only touches the header, so up-to-date variants cost no decode.
+            width, height = im.size
+            if im.getexif().get(EXIF_ORIENTATION, 1) in ROTATED_ORIENTATIONS:
+                width, height = height, width
+            upright = None
+            for w in VARIANT_WIDTHS:
+                if w >= width:
+                    break
+                # Encode settings are in the name: changing them gives new files and new URLs,
+                # so clients holding the old (immutable-cached) variant pick up the change
+                out_name = f"{stem}-{w}-q{VARIANT_QUALITY}.webp"
+                out_path = os.path.join(variant_folder, out_name)
+                if not os.path.exists(out_path) or os.path.getmtime(out_path) < os.path.getmtime(src_path):
+                    os.makedirs(variant_folder, exist_ok=True)
+                    if upright is None:
+                        upright = ImageOps.exif_transpose(im)
+                    h = round(height * w / width)
+                    upright.resize((w, h), Image.LANCZOS).save(out_path, "WEBP", quality=VARIANT_QUALITY)
+                entries.append(f"{image_url(variant_folder, out_name, version)} {w}w")
+            if entries:
+                # The original stays the widest candidate, so HiDPI screens never upscale a variant
+                entries.append(f"{image_url(image_folder, name, version)} {width}w")
+    except Exception as e:
+        print(f"[WARN] could not create resized variants for {src_path}: {e}")
+        return ""
+
+    return ", ".join(entries)
+
+
+# ---------------- HTML ----------------
+
+HTML_TEMPLATE = r"""<!DOCTYPE html>
+<!--sig:__SIGNATURE__-->
 <html>
 <head>
 <meta charset="UTF-8">
 <title>Interactive Side-View Binder</title>
 <meta name="viewport" content="width=device-width, initial-scale=1.0">
+<link rel="preload" as="fetch" href="__DATA_URL__" crossorigin>
+__PRELOAD_LINKS__
 <style>
-body {{
+body {
     margin: 0;
     background: #cfcfcf;
     display: flex;
@@ -31,34 +145,36 @@ body {{
     align-items: center;
     font-family: Arial, sans-serif;
     min-height: 100vh;
-}}
+}
 
-.slider-container {{
+.slider-container {
     width: 90%;
     max-width: 1100px;
     margin-bottom: 10px;
     display: none;
-}}
+}
 
-input[type=range] {{
+input[type=range] {
     width: 100%;
-}}
+}
 
-.binder-container {{
+.binder-container {
     perspective: 1500px;
     width: 90%;
     max-width: 1100px;
-}}
+    /* no paint containment here: it would clip the cover mid-flip */
+    contain: layout style;
+}
 
-.binder {{
+.binder {
     width: 100%;
     height: 0;
     padding-bottom: 59.09%;
     position: relative;
     cursor: pointer;
-}}
+}
 
-.page {{
+.page {
     width: 50%;
     height: 100%;
     position: absolute;
@@ -73,19 +189,35 @@ input[type=range] {{
     opacity: 0;
     transition: opacity 0.5s ease;
     z-index: 10;
-}}
+    contain: layout paint style;
+    content-visibility: auto;
+    contain-intrinsic-size: 550px 650px;
+}
+
+.page picture {
+    display: contents;
+}
 
-.page img {{
+.page img {
+    position: absolute;
+    inset: 0;
+    margin: auto;
     max-width: 95%;
     max-height: 95%;
     object-fit: contain;
     cursor: zoom-in;
-}}
+    opacity: 0;
+    transition: opacity 150ms ease;
+}
+
+.page img.is-shown {
+    opacity: 1;
+}
 
-.left-page {{ left: 0; }}
-.right-page {{ right: 0; }}
+.left-page { left: 0; }
+.right-page { right: 0; }
 
-.right-cover {{
+.right-cover {
     width: 50%;
     height: 100%;
     background: #5a6b7c;
@@ -97,14 +229,15 @@ input[type=range] {{
     transform-origin: left center;
     transition: transform 1s ease, z-index 0s 1s;
     z-index: 20;
-}}
+    will-change: transform;
+}
 
-.right-cover.open {{
+.right-cover.open {
     transform: rotateY(180deg);
     z-index: 0;
-}}
+}
 
-.ring {{
+.ring {
     width: 2.2%;
     max-width: 24px;
     aspect-ratio: 1/1;
@@ -119,78 +252,58 @@ input[type=range] {{
     opacity: 0;
     transition: opacity 0.5s ease 0.5s;
     z-index: 15;
-}}
+}
 
-.ring1 {{ top: 20.1%; }}
-.ring2 {{ top: 47.7%; }}
-.ring3 {{ top: 75.3%; }}
+.ring1 { top: 20.1%; }
+.ring2 { top: 47.7%; }
+.ring3 { top: 75.3%; }
 
-.controls {{
+.controls {
     text-align: center;
     display: none;
     width: 90%;
     max-width: 1100px;
     margin-top: 8px;
-}}
-
-button {{
-    padding: 10px 15px;
-    margin: 0 5px;
-    border: none;
-    border-radius: 6px;
-    background: #333;
-    color: white;
-    cursor: pointer;
-}}
-
-button:hover {{
-    background: #555;
-}}
-
-.page-info {{
-    margin-top: 8px;
-    font-size: 12px;
-    color: #333;
-}}
+}
 
-#fullscreenOverlay {{
-    position: fixed;
-    top:0;
-    left:0;
-    width:100%;
-    height:100%;
-    background: rgba(0,0,0,0.9);
+/* Rest of the styles sit at the end of <body>; this keeps the overlay hidden until then */
+#fullscreenOverlay {
     display: none;
-    justify-content: center;
-    align-items: center;
-    z-index: 9999;
-}}
-
-#fullscreenOverlay img {{
-    max-width: 95%;
-    max-height: 95%;
-    object-fit: contain;
-}}
+}
 </style>
 </head>
 <body>
 
 <div class="slider-container">
-    <input type="range" id="pageSlider" min="0" max="{max(len(images)-2,0)}" step="1">
+    <input type="range" id="pageSlider" min="0" max="__MAX_INDEX__" step="1">
 </div>
 
 <div class="binder-container">
     <div id="binder" class="binder">
         <div class="page left-page">
-            <img id="leftPage">
+            <picture>
+                <source id="leftSource-a" sizes="__PAGE_SIZES__">
+                <img id="leftPage-a" decoding="async" fetchpriority="high" loading="eager">
+            </picture>
+            <picture>
+                <source id="leftSource-b" sizes="__PAGE_SIZES__">
+                <img id="leftPage-b" decoding="async" fetchpriority="high" loading="eager">
+            </picture>
         </div>
         <div class="page right-page">
-            <img id="rightPage">
+            <picture>
+                <source id="rightSource-a" sizes="__PAGE_SIZES__">
+                <img id="rightPage-a" decoding="async" fetchpriority="high" loading="eager">
+            </picture>
+            <picture>
+                <source id="rightSource-b" sizes="__PAGE_SIZES__">
+                <img id="rightPage-b" decoding="async" fetchpriority="high" loading="eager">
+            </picture>
         </div>
         <div id="rightCover" class="right-cover"></div>
-        <div class="ring ring1"></div>
-        <div class="ring ring2"></div>
-        <div class="ring ring3"></div>
+        <div id="ring1" class="ring ring1"></div>
+        <div id="ring2" class="ring ring2"></div>
+        <div id="ring3" class="ring ring3"></div>
     </div>
 </div>
 
@@ -200,17 +313,37 @@ button:hover {{
     <div class="page-info" id="pageInfo"></div>
 </div>
 
-<div id="fullscreenOverlay"><img id="fullscreenImg"></div>
+<div id="fullscreenOverlay"><img id="fullscreenImg" loading="lazy" decoding="async"></div>
 
 <script>
-var images = {json.dumps(images)};
-var basePath = "{IMAGE_FOLDER}/";
+// Image list lives in a sibling JSON file so it parses and caches on its own
+var images = [];  // ready-to-use URLs: quoted and versioned by binder.py
+var srcsets = [];
+var pageSizes = "__PAGE_SIZES__";
+
+function imagePath(i) {
+    return images[i];
+}
 
 var currentIndex = 1;
 var firstSpread = true;
 
-var leftPage = document.getElementById("leftPage");
-var rightPage = document.getElementById("rightPage");
+// Each page has two stacked <img> layers; the hidden one loads the next image
+function makeSlot(side) {
+    return {
+        active: 0,
+        pending: "",
+        layers: ["a", "b"].map(function(k) {
+            return {
+                img: document.getElementById(side + "Page-" + k),
+                source: document.getElementById(side + "Source-" + k)
+            };
+        })
+    };
+}
+
+var leftSlot = makeSlot("left");
+var rightSlot = makeSlot("right");
 var pageInfo = document.getElementById("pageInfo");
 var slider = document.getElementById("pageSlider");
 var rightCover = document.getElementById("rightCover");
@@ -220,28 +353,104 @@ var sliderContainer = document.querySelector(".slider-container");
 var leftPageDiv = document.querySelector(".left-page");
 var rightPageDiv = document.querySelector(".right-page");
 
-var pages = document.querySelectorAll(".page");
-var rings = document.querySelectorAll(".ring");
+var binderContainer = document.querySelector(".binder-container");
+var pageSlots = new WeakMap([[leftPageDiv, leftSlot], [rightPageDiv, rightSlot]]);
+var rings = [
+    document.getElementById("ring1"),
+    document.getElementById("ring2"),
+    document.getElementById("ring3")
+];
 
 var fullscreenOverlay = document.getElementById("fullscreenOverlay");
 var fullscreenImg = document.getElementById("fullscreenImg");
 
-function renderSpread() {{
-    if (firstSpread) {{
-        leftPage.src = "";
-        rightPage.src = images[0] ? basePath + images[0] : "";
+// Decode into the hidden layer, then cross-fade so the swap is atomic
+function setPage(slot, i) {
+    var path = images[i] ? imagePath(i) : "";
+    var front = slot.layers[slot.active];
+    var back = slot.layers[1 - slot.active];
+    if (path && path === slot.pending) return;
+    slot.pending = path;
+
+    if (!path) {
+        slot.layers.forEach(function(layer) {
+            layer.img.classList.remove("is-shown");
+            layer.source.removeAttribute("srcset");
+            layer.img.removeAttribute("src");
+        });
+        return;
+    }
+
+    back.source.srcset = srcsets[i];
+    back.img.src = path;
+    return back.img.decode().catch(function() {}).then(function() {
+        // Skip if a newer spread was requested while this one decoded
+        if (slot.pending !== path) return;
+        back.img.classList.add("is-shown");
+        front.img.classList.remove("is-shown");
+        slot.active = 1 - slot.active;
+    });
+}
+
+// Keep the neighbouring spreads decoded; the Map holds references so they aren't GC'd
+var preloaded = new Map();
+var PRELOAD_CAP = 8;
+
+// Detached images must stay eager: a lazy one never intersects the viewport, so it never loads
+function preload(i, priority) {
+    if (i < 0 || !images[i]) return;
+    var path = imagePath(i);
+    if (preloaded.has(path)) {
+        var hit = preloaded.get(path);
+        preloaded.delete(path);
+        preloaded.set(path, hit);
+        return;
+    }
+    var im = new Image();
+    im.fetchPriority = priority;
+    im.decoding = "async";
+    im.sizes = pageSizes;
+    im.srcset = srcsets[i];
+    im.src = path;
+    im.decode().catch(function() {});
+    preloaded.set(path, im);
+    if (preloaded.size > PRELOAD_CAP) preloaded.delete(preloaded.keys().next().value);
+}
+
+// Only prerender once the reader has actually opened the binder
+function preloadAround() {
+    if (!rightCover.classList.contains("open")) return;
+
+    if (firstSpread) {
+        preload(1, "auto");
+        preload(2, "auto");
+        return;
+    }
+    // Forward reading is the common case, so the next spread goes first
+    preload(currentIndex + 2, "auto");
+    preload(currentIndex + 3, "auto");
+    preload(currentIndex - 2, "low");
+    preload(currentIndex - 1, "low");
+}
+
+function renderSpread() {
+    if (firstSpread) {
+        setPage(leftSlot, -1);
+        setPage(rightSlot, 0);
         pageInfo.textContent = "Page 1 of " + images.length;
         slider.value = 0;
-    }} else {{
-        leftPage.src = images[currentIndex] ? basePath + images[currentIndex] : "";
-        rightPage.src = images[currentIndex + 1] ? basePath + images[currentIndex + 1] : "";
+    } else {
+        setPage(leftSlot, currentIndex);
+        setPage(rightSlot, currentIndex + 1);
         pageInfo.textContent = "Pages " + (currentIndex + 1) + "-" + Math.min(currentIndex + 2, images.length) + " of " + images.length;
         slider.value = currentIndex;
-    }}
-}}
+    }
+
+    preloadAround();
+}
 
-function nextSpread() {{
-    if (firstSpread) {{
+function nextSpread() {
+    if (firstSpread) {
         firstSpread = false;
         currentIndex = 1;
 
@@ -251,16 +460,16 @@ function nextSpread() {{
 
         renderSpread();
         return;
-    }}
+    }
 
-    if (currentIndex + 2 < images.length) {{
+    if (currentIndex + 2 < images.length) {
         currentIndex += 2;
         renderSpread();
-    }}
-}}
+    }
+}
 
-function prevSpread() {{
-    if (!firstSpread && currentIndex - 2 < 1) {{
+function prevSpread() {
+    if (!firstSpread && currentIndex - 2 < 1) {
         firstSpread = true;
 
         // Hide left page again
@@ -269,32 +478,65 @@ function prevSpread() {{
 
         renderSpread();
         return;
-    }}
+    }
 
-    if (currentIndex - 2 >= 1) {{
+    if (currentIndex - 2 >= 1) {
         currentIndex -= 2;
         renderSpread();
-    }}
-}}
+    }
+}
+
+// Dragging fires many input events per frame; only render the latest value once per frame
+var sliderFramePending = false;
+
+slider.addEventListener("input", function() {
+    if (sliderFramePending) return;
+    sliderFramePending = true;
+
+    requestAnimationFrame(function() {
+        sliderFramePending = false;
+        var val = parseInt(slider.value);
+
+        if (val === 0) {
+            firstSpread = true;
+            leftPageDiv.style.opacity = 0;
+            rightPageDiv.style.opacity = 1;
+        } else {
+            firstSpread = false;
+            currentIndex = val;
+            leftPageDiv.style.opacity = 1;
+            rightPageDiv.style.opacity = 1;
+        }
 
-slider.addEventListener("input", function() {{
-    var val = parseInt(slider.value);
-
-    if (val === 0) {{
-        firstSpread = true;
-        leftPageDiv.style.opacity = 0;
-        rightPageDiv.style.opacity = 1;
-    }} else {{
-        firstSpread = false;
-        currentIndex = val;
-        leftPageDiv.style.opacity = 1;
-        rightPageDiv.style.opacity = 1;
-    }}
-
-    renderSpread();
-}});
+        renderSpread();
+    });
+});
+
+// Resolves to true once the image list is in, false if it could not be loaded
+var ready = fetch(__DATA_URL_JSON__)
+    .then(function(r) {
+        if (!r.ok) throw new Error("HTTP " + r.status);
+        return r.json();
+    })
+    .then(function(data) {
+        images = data.images;
+        srcsets = data.srcsets;
+        slider.max = Math.max(images.length - 2, 0);
+        return true;
+    })
+    .catch(function(err) {
+        console.error("Could not load the binder image list:", err);
+        pageInfo.textContent = "Could not load the binder pages. Open this page through a web server and reload.";
+        controls.style.display = "block";
+        return false;
+    });
+
+rightCover.addEventListener("click", function(e) {
+    e.stopPropagation();
+    ready.then(function(ok) { if (ok) openBinder(); });
+});
 
-rightCover.addEventListener("click", function(e) {{
+function openBinder() {
     rightCover.classList.add("open");
 
     // Only show right page initially
@@ -307,38 +549,167 @@ rightCover.addEventListener("click", function(e) {{
 
     firstSpread = true;
     renderSpread();
-    e.stopPropagation();
-}});
-
-document.addEventListener("keydown", function(e) {{
-    if (e.key === "ArrowRight") nextSpread();
-    if (e.key === "ArrowLeft") prevSpread();
-}});
+}
+
+// Holding an arrow key auto-repeats; flip at most one spread per frame
+var keyFramePending = false;
+
+document.addEventListener("keydown", function(e) {
+    if (e.key !== "ArrowRight" && e.key !== "ArrowLeft") return;
+    e.preventDefault();
+    if (keyFramePending) return;
+    keyFramePending = true;
+
+    var forward = e.key === "ArrowRight";
+    requestAnimationFrame(function() {
+        keyFramePending = false;
+        ready.then(function(ok) {
+            if (ok) (forward ? nextSpread : prevSpread)();
+        });
+    });
+});
 
 // Fullscreen
-function toggleFullscreen(src) {{
+function toggleFullscreen(src) {
     fullscreenImg.src = src;
     fullscreenOverlay.style.display = "flex";
-}}
-
-pages.forEach(page => {{
-    page.addEventListener("click", function(e) {{
-        var img = page.querySelector("img");
-        if (img && img.src) toggleFullscreen(img.src);
-        e.stopPropagation();
-    }});
-}});
+}
+
+// One delegated listener for both pages instead of one per page
+binderContainer.addEventListener("click", function(e) {
+    var page = e.target.closest(".page");
+    if (!page) return;
+    var slot = pageSlots.get(page);
+    var img = slot && slot.layers[slot.active].img;
+    if (img && img.classList.contains("is-shown")) toggleFullscreen(img.src);
+    e.stopPropagation();
+});
 
-fullscreenOverlay.addEventListener("click", function() {{
+fullscreenOverlay.addEventListener("click", function() {
     fullscreenOverlay.style.display = "none";
-}});
+});
 </script>
 
+<!-- Non-critical styles: controls and fullscreen overlay are only used after the cover opens -->
+<style>
+button {
+    padding: 10px 15px;
+    margin: 0 5px;
+    border: none;
+    border-radius: 6px;
+    background: #333;
+    color: white;
+    cursor: pointer;
+}
+
+button:hover {
+    background: #555;
+}
+
+.page-info {
+    margin-top: 8px;
+    font-size: 12px;
+    color: #333;
+}
+
+#fullscreenOverlay {
+    position: fixed;
+    top:0;
+    left:0;
+    width:100%;
+    height:100%;
+    background: rgba(0,0,0,0.9);
+    display: none;
+    justify-content: center;
+    align-items: center;
+    z-index: 9999;
+}
+
+#fullscreenOverlay img {
+    max-width: 95%;
+    max-height: 95%;
+    object-fit: contain;
+}
+</style>
+
 </body>
 </html>
 """
 
-with open(OUTPUT_FILE, "w", encoding="utf-8") as f:
-    f.write(html)
 
-print(f"Interactive binder generated: {OUTPUT_FILE}")
+def preload_link(href, srcset):
+    # imagesrcset/imagesizes make the browser fetch the same candidate the page will pick
+    attrs = f' imagesrcset="{escape(srcset)}" imagesizes="{escape(PAGE_SIZES)}"' if srcset else ""
+    return f'<link rel="preload" as="image" href="{escape(href)}"{attrs} fetchpriority="low">'
+
+
+def generate_html(images, versions, srcsets, image_folder, data_url, signature):
+    # Warm the first spread while the cover animation runs
+    preload_links = "\n".join(
+        preload_link(image_url(image_folder, f, v), srcset)
+        for f, v, srcset in zip(images[:2], versions, srcsets)
+    )
+
+    template_values = {
+        "SIGNATURE": signature,
+        "PRELOAD_LINKS": preload_links,
+        "MAX_INDEX": str(max(len(images) - 2, 0)),
+        "PAGE_SIZES": PAGE_SIZES,
+        "DATA_URL": escape(data_url),
+        "DATA_URL_JSON": json.dumps(data_url),
+    }
+
+    # One pass over the template instead of formatting a giant f-string
+    return re.sub(r"__([A-Z_]+)__", lambda m: template_values[m.group(1)], HTML_TEMPLATE)
+
+
+# _headers is site-wide config: add our block if it's missing, never rewrite other rules
+def write_cache_headers(headers_path, image_folder):
+    rule = f"/{image_folder}/*"
+    existing = ""
+    if os.path.exists(headers_path):
+        with open(headers_path, encoding="utf-8") as f:
+            existing = f.read()
+        if rule in (line.strip() for line in existing.splitlines()):
+            return
+
+    with open(headers_path, "a", encoding="utf-8") as f:
+        if existing and not existing.endswith("\n"):
+            f.write("\n")
+        f.write(f"{rule}\n  Cache-Control: public, max-age=31536000, immutable\n")
+
+
+def build(image_folder=IMAGE_FOLDER, output_file=OUTPUT_FILE):
+    images = scan_images(image_folder)
+    if not images:
+        print("No images found in folder.")
+        return
+
+    data_path = os.path.splitext(output_file)[0] + DATA_SUFFIX
+    signature = build_signature(image_folder, images)
+    if is_up_to_date(output_file, data_path, signature):
+        print(f"Interactive binder up to date: {output_file}")
+        return
+
+    versions = [image_version(image_folder, f) for f in images]
+    srcsets = [make_variants(image_folder, f, v) for f, v in zip(images, versions)]
+    data_json = json.dumps(
+        {"images": [image_url(image_folder, f, v) for f, v in zip(images, versions)], "srcsets": srcsets},
+        separators=JSON_SEPARATORS,
+    )
+    data_url = f"{os.path.basename(data_path)}?v={hashlib.md5(data_json.encode()).hexdigest()[:10]}"
+    html = generate_html(images, versions, srcsets, image_folder, data_url, signature)
+
+    with open(data_path, "w", encoding="utf-8") as f:
+        f.write(data_json)
+
+    with open(output_file, "w", encoding="utf-8") as f:
+        f.write(html)
+
+    write_cache_headers(os.path.join(os.path.dirname(output_file), HEADERS_FILE), image_folder)
+
+    print(f"Interactive binder generated: {output_file}")
+
+
+if __name__ == "__main__":
+    build()
@@ -1,84 +1,118 @@
 #!/usr/bin/env python3
 import os
 import re
+import gzip
 import json
+import zlib
+import base64
+import shutil
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
+from typing import Optional, Tuple
 
-from PIL import Image  # pip install Pillow
+from PIL import Image  # pip install Pillow (or pillow-simd, a faster drop-in)
+
+try:
+    import brotli  # optional: pip install brotli, for a .br sibling
+except ImportError:
+    brotli = None
+
+try:
+    import pillow_jxl  # optional: pip install pillow-jxl-plugin, for .jxl thumbnails
+except ImportError:
+    pillow_jxl = None
 
 IMAGES_DIR = Path("images")
 THUMBS_DIR = IMAGES_DIR / "thumbs"
 FONTS_DIR = Path("fonts")   # optional: host fonts locally here
 OUTPUT_HTML = Path("timeline.html")
+CACHE_FILE = Path(".timeline_cache.json")  # parsed events from the previous run
+CACHE_VERSION = 7  # bump when the event shape or parsing rules change
 
 THUMB_MAX_SIZE = (800, 800)
 JPEG_QUALITY = 80
+JXL_QUALITY = 85
+SIDECAR_READ_WORKERS = 16
+JSON_SEPARATORS = (",", ":")  # compact events JSON in the page and the cache
+EVENTS_GZIP_THRESHOLD = 100_000  # characters of events JSON; above this it is embedded gzipped
+
+_JPEG_SAVE_KW = {"optimize": True, "quality": JPEG_QUALITY, "progressive": True}
+_SAVE_KW = {
+    ".jpg": _JPEG_SAVE_KW,
+    ".jpeg": _JPEG_SAVE_KW,
+    ".png": {"optimize": True},
+}
+
+
+# Filename patterns, compiled once (see parse_date_from_filename)
+# Alternatives are tried left to right, same order as the docstring's rules 1-4
+_RE_DATE_PREFIX = re.compile(
+    r"^(?:"
+    r"(?P<y1>\d{4})[-_](?P<m1>\d{1,2})[-_](?P<d1>\d{1,2})"
+    r"|(?P<d2>\d{1,2})-(?P<m2>\d{1,2})-(?P<y2>\d{4})"
+    r"|(?P<m3>\d{1,2})-(?P<y3>\d{4})"
+    r"|(?P<y4>\d{4})"
+    r")(?:[-_](?P<rest>.*))?$"
+)
+_RE_ANYY = re.compile(r"(19|20)\d{2}")
+_RE_STRIP_UNDERSCORE = re.compile(r"^[-_]+|[-_]+$")
+_RE_SLUG_SEP = re.compile(r"[-_]+")
+_RE_WORD_START = re.compile(r"\b\w")  # also after apostrophes and dots: "l'église" -> "L'Église"
 
 
 # ---------------- Helpers ----------------
 
+@lru_cache(maxsize=4096)
 def humanize_title(slug: str) -> str:
     if not slug:
         return "Untitled"
-    text = re.sub(r"[-_]+", " ", slug).strip()
-    return re.sub(r"\b\w", lambda m: m.group(0).upper(), text)
+    text = _RE_SLUG_SEP.sub(" ", slug).strip()
+    if not text:
+        return "Untitled"  # e.g. a "-" slug; the page relies on title never being empty
+    # A callback, not split/join: only \b finds word starts after ' . ( as well as spaces
+    return _RE_WORD_START.sub(lambda m: m.group(0).upper(), text)
 
 
-def parse_date_from_filename(filename: str):
+def parse_date_from_filename(name: str) -> Tuple[Optional[datetime], str, str, Optional[int]]:
     """
-    Parse date from the filename.
+    Parse date from the filename, given without its extension.
     Tries (in order):
       1) YYYY-MM-DD or YYYY_MM_DD at the start
       2) DD-MM-YYYY-...
       3) MM-YYYY-...
       4) YYYY-...
       5) Any 4-digit year (19xx or 20xx) anywhere in the name
-    Returns (date_obj, label, rest_slug)
+    Returns (date_obj, label, rest_slug, year); year is still filled in when
+    the date itself is invalid but a 19xx/20xx year can be read from the name.
     """
-    name = os.path.splitext(filename)[0]
-
-    m = re.match(r"^(\d{4})[-_](\d{1,2})[-_](\d{1,2})(?:[-_](.*))?$", name)
-    if m:
-        yyyy, mm, dd, rest = m.groups()
-        try:
-            dt = datetime(int(yyyy), int(mm), int(dd))
-        except ValueError:
-            dt = None
-        label = f"{yyyy}-{mm.zfill(2)}-{dd.zfill(2)}"
-        return dt, label, (rest or "")
-
-    m = re.match(r"^(\d{1,2})-(\d{1,2})-(\d{4})(?:[-_](.*))?$", name)
+    m = _RE_DATE_PREFIX.match(name)
     if m:
-        dd, mm, yyyy, rest = m.groups()
+        g = m.groupdict()
+        if g["y1"]:
+            yyyy, mm, dd = g["y1"], g["m1"], g["d1"]
+            label = f"{yyyy}-{mm.zfill(2)}-{dd.zfill(2)}"
+        elif g["y2"]:
+            yyyy, mm, dd = g["y2"], g["m2"], g["d2"]
+            label = f"{dd.zfill(2)}-{mm.zfill(2)}-{yyyy}"
+        elif g["y3"]:
+            yyyy, mm, dd = g["y3"], g["m3"], "1"
+            label = f"{mm.zfill(2)}-{yyyy}"
+        else:
+            yyyy, mm, dd = g["y4"], "1", "1"
+            label = f"{yyyy}"
         try:
             dt = datetime(int(yyyy), int(mm), int(dd))
+            year = dt.year
         except ValueError:
             dt = None
-        label = f"{dd.zfill(2)}-{mm.zfill(2)}-{yyyy}"
-        return dt, label, (rest or "")
+            m_year = _RE_ANYY.search(label) or _RE_ANYY.search(name)
+            year = int(m_year.group(0)) if m_year else None
+        return dt, label, (g["rest"] or ""), year
 
-    m = re.match(r"^(\d{1,2})-(\d{4})(?:[-_](.*))?$", name)
-    if m:
-        mm, yyyy, rest = m.groups()
-        try:
-            dt = datetime(int(yyyy), int(mm), 1)
-        except ValueError:
-            dt = None
-        label = f"{mm.zfill(2)}-{yyyy}"
-        return dt, label, (rest or "")
-
-    m = re.match(r"^(\d{4})(?:[-_](.*))?$", name)
-    if m:
-        yyyy, rest = m.groups()
-        try:
-            dt = datetime(int(yyyy), 1, 1)
-        except ValueError:
-            dt = None
-        label = f"{yyyy}"
-        return dt, label, (rest or "")
-
-    m = re.search(r"(19|20)\d{2}", name)
+    m = _RE_ANYY.search(name)
     if m:
         yyyy = int(m.group(0))
         try:
@@ -87,95 +121,249 @@ def parse_date_from_filename(filename: str):
             dt = None
         label = str(yyyy)
         rest = name.replace(str(yyyy), "")
-        rest = re.sub(r"^[-_]+|[-_]+$", "", rest)
-        return dt, label, rest
+        rest = _RE_STRIP_UNDERSCORE.sub("", rest)
+        return dt, label, rest, yyyy
 
-    return None, name, ""
+    return None, name, "", None
 
 
-def ensure_thumbnail(src_path: Path) -> Path:
-    THUMBS_DIR.mkdir(parents=True, exist_ok=True)
-    thumb_path = THUMBS_DIR / src_path.name
+def _jxl_thumb_name(thumb_name: str) -> str:
+    # Keep the full name: "X.jpg" and "X.png" must not share one "X.jxl"
+    return thumb_name + ".jxl"
 
-    if thumb_path.exists():
-        return thumb_path
 
+def _save_jxl_thumbnail(im, thumb_path: Path) -> bool:
+    jxl_path = thumb_path.with_name(_jxl_thumb_name(thumb_path.name))
+    try:
+        # lossless_jpeg=False: re-encode at JXL_QUALITY instead of wrapping the JPEG losslessly
+        im.save(jxl_path, quality=JXL_QUALITY, lossless_jpeg=False)
+        return True
+    except Exception as e:
+        print(f"[WARN] could not create JXL thumbnail for {thumb_path}: {e}")
+        jxl_path.unlink(missing_ok=True)  # never serve a half-written file
+        return False
+
+
+def _make_thumbnail(src_path: Path, thumb_path: Path) -> None:
     try:
         with Image.open(src_path) as im:
-            im = im.convert("RGB")
-            im.thumbnail(THUMB_MAX_SIZE)
-            save_kwargs = {"optimize": True}
-            if thumb_path.suffix.lower() in {".jpg", ".jpeg"}:
-                save_kwargs["quality"] = JPEG_QUALITY
-            im.save(thumb_path, **save_kwargs)
+            if im.format == "JPEG":
+                # Let libjpeg scale down by 1/2, 1/4 or 1/8 while decoding
+                im.draft("RGB", THUMB_MAX_SIZE)
+            if im.mode in ("1", "P"):
+                im = im.convert("RGB")  # palette images only resample with NEAREST
+            im.thumbnail(THUMB_MAX_SIZE, Image.Resampling.BILINEAR)  # thumbnail() already uses reducing_gap=2.0
+            if im.mode != "RGB":
+                im = im.convert("RGB")
+            im.save(thumb_path, **_SAVE_KW[thumb_path.suffix.lower()])
+            if pillow_jxl is not None:
+                _save_jxl_thumbnail(im, thumb_path)
     except Exception as e:
         print(f"[WARN] could not create thumbnail for {src_path}: {e}")
         try:
-            import shutil
             shutil.copy2(src_path, thumb_path)
         except Exception as e2:
             print(f"[WARN] and could not copy original either: {e2}")
 
-    return thumb_path
+
+def _worker_make_thumb(paths) -> None:
+    _make_thumbnail(*paths)
+
+
+def _worker_make_jxl_thumb(thumb_path: Path) -> bool:
+    try:
+        with Image.open(thumb_path) as im:
+            return _save_jxl_thumbnail(im, thumb_path)
+    except Exception as e:
+        print(f"[WARN] could not read thumbnail {thumb_path} for JXL: {e}")
+        return False
+
+
+def make_missing_jxl_thumbnails(thumb_paths) -> list:
+    """
+    Backfill .jxl siblings for existing thumbnails, encoding from the small thumbnail
+    rather than the original. Returns the thumbnails that could not be converted.
+    """
+    if not thumb_paths:
+        return []
+    workers = os.cpu_count() or 1
+    chunksize = max(1, len(thumb_paths) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        ok = list(executor.map(_worker_make_jxl_thumb, thumb_paths, chunksize=chunksize))
+    return [p for p, done in zip(thumb_paths, ok) if not done]
+
+
+def make_missing_thumbnails(sources) -> None:
+    """
+    Create thumbnails for `sources` (images known to lack one), spread across all cores.
+    A .jxl sibling is written too when pillow-jxl-plugin is installed.
+    Decode/resize/encode is CPU-bound, so a process pool scales nearly linearly.
+    THUMBS_DIR must already exist.
+    """
+    pending = [(src, THUMBS_DIR / src.name) for src in sources]
+    if not pending:
+        return
+
+    workers = os.cpu_count() or 1
+    chunksize = max(1, len(pending) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        list(executor.map(_worker_make_thumb, pending, chunksize=chunksize))
+
+
+def _load_event_cache() -> Tuple[dict, dict]:
+    """Return (events by image name, thumbnail mtime_ns by name for failed JXL conversions)."""
+    try:
+        data = json.loads(CACHE_FILE.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}, {}
+    if not isinstance(data, dict) or data.get("version") != CACHE_VERSION:
+        return {}, {}
+    return data.get("entries", {}), data.get("jxl_failed", {})
+
+
+def _save_event_cache(entries: dict, jxl_failed: dict) -> None:
+    data = {"version": CACHE_VERSION, "entries": entries, "jxl_failed": jxl_failed}
+    try:
+        CACHE_FILE.write_text(
+            json.dumps(data, ensure_ascii=False, separators=JSON_SEPARATORS),
+            encoding="utf-8",
+        )
+    except OSError as e:
+        print(f"[WARN] could not write event cache {CACHE_FILE}: {e}")
+
+
+def _event_cache_key(entry, txt_entry, has_jxl: bool, has_jxl_thumb: bool) -> list:
+    st = entry.stat()
+    key = [st.st_size, st.st_mtime_ns, has_jxl, has_jxl_thumb]
+    if txt_entry is not None:
+        txt_st = txt_entry.stat()
+        key += [txt_st.st_size, txt_st.st_mtime_ns]
+    return key
 
 
 def collect_events():
     if not IMAGES_DIR.is_dir():
         raise SystemExit(f"Images directory not found: {IMAGES_DIR}")
 
-    events = []
-    for entry in sorted(IMAGES_DIR.iterdir()):
-        if not entry.is_file():
-            continue
+    # One scandir pass: DirEntry caches file type, and the name set answers sidecar lookups
+    with os.scandir(IMAGES_DIR) as it:
+        dir_entries = sorted(it, key=lambda e: e.name)
+    by_name = {e.name: e for e in dir_entries}
+    all_names = by_name.keys()
 
-        ext = entry.suffix.lower()
-        if ext not in {".jpg", ".jpeg", ".png"}:
+    # Split each name once; base_no_ext is reused for parsing, sidecars and labels
+    entries = []
+    for entry in dir_entries:
+        if not entry.is_file(follow_symlinks=False):
             continue
+        base_no_ext, ext = os.path.splitext(entry.name)
+        if ext.lower() in {".jpg", ".jpeg", ".png"}:
+            entries.append((entry, base_no_ext))
 
-        dt, label, rest_slug = parse_date_from_filename(entry.name)
+    cache, jxl_failed = _load_event_cache()
 
-        full_rel_path = f"{IMAGES_DIR.name}/{entry.name}"
+    # One directory scan answers "has a thumbnail?" for every image
+    THUMBS_DIR.mkdir(parents=True, exist_ok=True)
+    with os.scandir(THUMBS_DIR) as it:
+        existing_thumbs = {e.name for e in it}
+    missing = [Path(e.path) for e, _ in entries if e.name not in existing_thumbs]
+    if missing:
+        make_missing_thumbnails(missing)
+        with os.scandir(THUMBS_DIR) as it:
+            existing_thumbs = {e.name for e in it}
+
+    # Backfill JXL thumbnails; a thumbnail that failed before is only retried once it changes
+    new_jxl_failed = {}
+    if pillow_jxl is not None:
+        jxl_pending = []
+        for entry, _ in entries:
+            name = entry.name
+            if name not in existing_thumbs or _jxl_thumb_name(name) in existing_thumbs:
+                continue
+            thumb_path = THUMBS_DIR / name
+            mtime_ns = thumb_path.stat().st_mtime_ns
+            if jxl_failed.get(name) == mtime_ns:
+                new_jxl_failed[name] = mtime_ns
+            else:
+                jxl_pending.append(thumb_path)
+        for thumb_path in make_missing_jxl_thumbnails(jxl_pending):
+            new_jxl_failed[thumb_path.name] = thumb_path.stat().st_mtime_ns
+        existing_thumbs.update(_jxl_thumb_name(p.name) for p in jxl_pending if p.name not in new_jxl_failed)
+
+    # Reuse last run's event for any image whose file and sidecars are unchanged
+    new_cache = {}
+    events_by_name = {}
+    misses = []
+    for entry, base_no_ext in entries:
+        key = _event_cache_key(
+            entry,
+            by_name.get(base_no_ext + ".txt"),
+            base_no_ext + ".jxl" in all_names,
+            _jxl_thumb_name(entry.name) in existing_thumbs,
+        )
+        hit = cache.get(entry.name)
+        if hit and hit.get("key") == key and entry.name in existing_thumbs:
+            events_by_name[entry.name] = dict(hit["event"])
+            new_cache[entry.name] = hit
+        else:
+            misses.append((entry, base_no_ext, key))
+
+    # Read all .txt sidecars in one batch; I/O-bound, so threads overlap the waits
+    txt_names = [
+        name for name in (base_no_ext + ".txt" for _, base_no_ext, _ in misses)
+        if name in all_names
+    ]
+    sidecar_texts = {}
+    if txt_names:  # usually empty on a warm-cache run; don't spin up a pool for nothing
+        with ThreadPoolExecutor(max_workers=SIDECAR_READ_WORKERS) as executor:
+            texts = executor.map(
+                lambda name: (IMAGES_DIR / name).read_text(encoding="utf-8", errors="ignore"),
+                txt_names,
+            )
+            sidecar_texts = dict(zip(txt_names, texts))
 
-        thumb_path = ensure_thumbnail(entry)
-        thumb_rel_path = f"{IMAGES_DIR.name}/{THUMBS_DIR.name}/{thumb_path.name}"
+    images_prefix = IMAGES_DIR.name
+    thumbs_prefix = f"{IMAGES_DIR.name}/{THUMBS_DIR.name}"
+    for entry, base_no_ext, key in misses:
+        name = entry.name
+        dt, label, rest_slug, year = parse_date_from_filename(base_no_ext)
 
-        base_no_ext = os.path.splitext(entry.name)[0]
-        title = humanize_title(rest_slug or entry.stem)
+        full_rel_path = f"{images_prefix}/{name}"
 
-        year = dt.year if dt else None
-        if year is None:
-            m = re.search(r"(19|20)\d{2}", label)
-            if m:
-                year = int(m.group(0))
-            else:
-                m2 = re.search(r"(19|20)\d{2}", base_no_ext)
-                if m2:
-                    year = int(m2.group(0))
+        thumb_rel_path = f"{thumbs_prefix}/{name}"
 
-        txt_path = IMAGES_DIR / (base_no_ext + ".txt")
-        text_content = ""
-        if txt_path.exists():
-            text_content = txt_path.read_text(encoding="utf-8", errors="ignore")
+        title = humanize_title(rest_slug or base_no_ext)
 
-        jxl_path = IMAGES_DIR / (base_no_ext + ".jxl")
-        jxl_rel_path = f"{IMAGES_DIR.name}/{base_no_ext}.jxl" if jxl_path.exists() else None
+        text_content = sidecar_texts.get(base_no_ext + ".txt", "")
 
-        events.append({
+        # full_image and title are always set, so the page needs no fallbacks;
+        # the optional JXL paths are left out rather than sent as null
+        event = {
             "image": thumb_rel_path,
             "full_image": full_rel_path,
-            "jxl_image": jxl_rel_path,
             "date_label": label,
             "file_label": base_no_ext,
             "title": title,
-            "description": "",
             "text": text_content,
             "year": year,
-            "sort_key": dt.isoformat() if dt else None,
-        })
+            # "\uffff" sorts after any ISO date: bad dates go last in their year, yearless last overall
+            "_sk": dt.isoformat() if dt else (f"{year:04d}\uffff" if year is not None else "\uffff"),
+        }
+        if base_no_ext + ".jxl" in all_names:
+            event["jxl_image"] = f"{images_prefix}/{base_no_ext}.jxl"
+        if _jxl_thumb_name(name) in existing_thumbs:
+            event["jxl_thumb"] = f"{thumbs_prefix}/{_jxl_thumb_name(name)}"
+        events_by_name[name] = event
+        new_cache[name] = {"key": key, "event": dict(event)}
+
+    _save_event_cache(new_cache, new_jxl_failed)
+
+    # Keep filename order so same-date events tie-break exactly as before
+    events = [events_by_name[entry.name] for entry, _ in entries]
 
-    events.sort(key=lambda ev: (ev["sort_key"] is None, ev["sort_key"] or ""))
+    events.sort(key=itemgetter("_sk"))
     for ev in events:
-        ev.pop("sort_key", None)
+        ev.pop("_sk", None)
     return events
 
 
@@ -213,11 +401,7 @@ def font_face_css_if_present() -> str:
 
 # ---------------- HTML ----------------
 
-def build_html(events):
-    events_json = json.dumps(events, ensure_ascii=False, indent=2)
-    font_face_css = font_face_css_if_present()
-
-    html_template = r"""<!DOCTYPE html>
+HTML_TEMPLATE = r"""<!DOCTYPE html>
 <html lang="en">
 <head>
   <meta charset="UTF-8" />
@@ -262,6 +446,17 @@ __FONT_FACE_CSS__
       --invert-images: 0;
     }
 
+    /* Typeface choices (set via <html data-font>); any other value keeps the default split */
+    html[data-font="atkinson"]{ --a11y-font-body: "Atkinson Hyperlegible", Arial, sans-serif; --a11y-font-ui: "Atkinson Hyperlegible", Arial, sans-serif; }
+    html[data-font="arial"]{ --a11y-font-body: Arial, Helvetica, sans-serif; --a11y-font-ui: Arial, Helvetica, sans-serif; }
+    html[data-font="tahoma"]{ --a11y-font-body: Tahoma, Arial, sans-serif; --a11y-font-ui: Tahoma, Arial, sans-serif; }
+    html[data-font="trebuchet"]{ --a11y-font-body: "Trebuchet MS", Arial, sans-serif; --a11y-font-ui: "Trebuchet MS", Arial, sans-serif; }
+    html[data-font="times"]{ --a11y-font-body: "Times New Roman", Times, serif; --a11y-font-ui: "Times New Roman", Times, serif; }
+    html[data-font="lexend"]{ --a11y-font-body: "Lexend", Arial, sans-serif; --a11y-font-ui: "Lexend", Arial, sans-serif; }
+    html[data-font="opendyslexic"]{ --a11y-font-body: "OpenDyslexic", Arial, sans-serif; --a11y-font-ui: "OpenDyslexic", Arial, sans-serif; }
+
+    html[data-invert="1"]{ --invert-images: 1; }
+
     html { font-size: calc(16px * var(--a11y-font-scale)); }
 
     body{
@@ -769,16 +964,27 @@ __FONT_FACE_CSS__
   </main>
 
   <script>
-    const events = __EVENTS_JSON__;
+    // build_html embeds a JSON string literal (JSON.parse scans it much faster than an
+    // object literal), or {gzip: "<base64>"} when the events JSON is over 100 KB
+    async function decodeEvents(payload) {
+      if (typeof payload === "string") return JSON.parse(payload);
+      const bytes = Uint8Array.from(atob(payload.gzip), (c) => c.charCodeAt(0));
+      const stream = new Blob([bytes]).stream().pipeThrough(new DecompressionStream("gzip"));
+      return JSON.parse(await new Response(stream).text());
+    }
+
+    const eventsReady = decodeEvents(__EVENTS_JSON__);
+    let events = [];
 
     const yearLoadState = {};
     let fullscreenOverlay = null;
     let fullscreenImage = null;
+    let fullscreenSource = null;
+    let a11yRefs = {};  // fixed a11y controls, looked up once at DOMContentLoaded
 
     function openFullscreen(src, alt, jxlSrc = null) {
       if (!fullscreenOverlay || !fullscreenImage) return;
-      const source = document.getElementById("fullscreen-source-jxl");
-      if (source) source.srcset = jxlSrc ? jxlSrc : "";
+      if (fullscreenSource) fullscreenSource.srcset = jxlSrc ? jxlSrc : "";
       fullscreenImage.src = src;
       fullscreenImage.alt = alt || "Full-size archive image";
       fullscreenOverlay.classList.add("is-visible");
@@ -791,8 +997,7 @@ __FONT_FACE_CSS__
       fullscreenOverlay.classList.remove("is-visible");
       setTimeout(() => {
         if (!fullscreenOverlay.classList.contains("is-visible")) {
-          const source = document.getElementById("fullscreen-source-jxl");
-          if (source) source.srcset = "";
+          if (fullscreenSource) fullscreenSource.srcset = "";
           fullscreenImage.src = "";
         }
       }, 350);
@@ -801,11 +1006,11 @@ __FONT_FACE_CSS__
     function showIntroOverlay() {
       if (!events || events.length === 0) return;
       const first = events[0];
-      const src = first.full_image || first.image;
+      const src = first.full_image;
       const jxl = first.jxl_image || null;
       const msg = document.getElementById("initial-message");
       if (msg) msg.classList.remove("hidden");
-      openFullscreen(src, first.title || first.file_label || "Archive photo", jxl);
+      openFullscreen(src, first.title, jxl);
     }
 
     function markYearImageLoaded(yearStr) {
@@ -819,9 +1024,126 @@ __FONT_FACE_CSS__
       }
     }
 
-    function renderTimeline(events) {
+    const NON_BLANK = /\S/;
+
+    // Shared load/error handler, so cards don't each allocate two closures
+    function onYearThumbSettled(e) {
+      markYearImageLoaded(e.currentTarget.closest(".timeline-item").dataset.year);
+    }
+
+    // Skeleton shared by every card; cloneNode(true) is cheaper than rebuilding it per event
+    function makeCardTemplate() {
+      const itemEl = document.createElement("article");
+      itemEl.className = "timeline-item";
+
+      const cardEl = document.createElement("div");
+      cardEl.className = "timeline-card";
+
+      const topLink = document.createElement("a");
+      topLink.className = "back-to-top";
+      topLink.textContent = "Top";
+      topLink.href = "#page-top";
+      cardEl.appendChild(topLink);
+
+      const headerEl = document.createElement("div");
+      headerEl.className = "timeline-header";
+      const dateEl = document.createElement("span");
+      dateEl.className = "timeline-date";
+      headerEl.appendChild(dateEl);
+      cardEl.appendChild(headerEl);
+
+      const imgWrapper = document.createElement("div");
+      imgWrapper.className = "timeline-image-wrapper";
+      const img = document.createElement("img");
+      img.className = "timeline-img";
+      img.decoding = "async";
+      imgWrapper.appendChild(img);
+      cardEl.appendChild(imgWrapper);
+
+      itemEl.appendChild(cardEl);
+      return itemEl;
+    }
+
+    // yearStr is null for the "Unknown Date" group, which has no nav pill to unlock
+    function makeTimelineItem(tpl, item, index, yearStr) {
+      const itemEl = tpl.cloneNode(true);
+      const cardEl = itemEl.firstChild;
+      const dateEl = cardEl.querySelector(".timeline-date");
+      const img = cardEl.querySelector("img");
+
+      itemEl.dataset.eventIndex = index.toString();
+      if (yearStr !== null) itemEl.dataset.year = yearStr;
+
+      const hasText = !!item.text && NON_BLANK.test(item.text);  // no trimmed copy per card
+      if (hasText) itemEl.classList.add("timeline-item-full");
+
+      dateEl.textContent = item.date_label || "";
+      if (item.file_label) {
+        const fileEl = document.createElement("span");
+        fileEl.className = "timeline-file";
+        fileEl.textContent = item.file_label;
+        dateEl.parentNode.appendChild(fileEl);
+      }
+
+      // Only cards with a JXL thumbnail need a <picture>; wrap before setting src so the browser picks once
+      if (item.jxl_thumb) {
+        const picture = document.createElement("picture");
+        const source = document.createElement("source");
+        source.type = "image/jxl";
+        source.srcset = item.jxl_thumb;
+        img.replaceWith(picture);
+        picture.append(source, img);
+      }
+
+      img.src = item.image;  // thumbnail
+      img.alt = item.title;
+      img.dataset.full = item.full_image;
+      img.dataset.jxl = item.jxl_image || "";
+
+      if (yearStr !== null) {
+        img.addEventListener("load", onYearThumbSettled);
+        img.addEventListener("error", onYearThumbSettled);
+      }
+
+      if (hasText) {
+        const textBox = document.createElement("div");
+        textBox.className = "timeline-textbox";
+        textBox.textContent = item.text;
+        cardEl.appendChild(textBox);
+      }
+
+      return itemEl;
+    }
+
+    let renderGeneration = 0;  // bumped per render so a stale chunked render stops early
+    const FRAME_BUDGET_MS = 8;
+
+    function makeYearGroup(cardTpl, headingText, groupId, entries, yearStr) {
+      const groupEl = document.createElement("section");
+      groupEl.className = "timeline-year-group";
+      if (groupId) groupEl.id = groupId;
+
+      const heading = document.createElement("h2");
+      heading.className = "timeline-year-heading";
+      heading.textContent = headingText;
+      groupEl.appendChild(heading);
+
+      const gridEl = document.createElement("div");
+      gridEl.className = "timeline-year-grid";
+      entries.forEach(({ item, index }) => {
+        gridEl.appendChild(makeTimelineItem(cardTpl, item, index, yearStr));
+      });
+
+      groupEl.appendChild(gridEl);
+      return groupEl;
+    }
+
+    // Builds year groups in ~8 ms slices, yielding a frame between slices so the
+    // first screen paints before a large archive is fully rendered
+    async function renderTimeline(events) {
+      const generation = ++renderGeneration;
       const container = document.getElementById("timeline");
-      container.innerHTML = "";
+      container.replaceChildren();
       Object.keys(yearLoadState).forEach((k) => delete yearLoadState[k]);
 
       const yearMap = new Map();
@@ -839,203 +1161,74 @@ __FONT_FACE_CSS__
         .sort((a, b) => a - b)
         .map((n) => String(n));
 
-      const hasUnknown = yearMap.has(UNKNOWN_KEY);
-
       numericYears.forEach((yearStr) => {
         const entries = yearMap.get(yearStr) || [];
         yearLoadState[yearStr] = { total: entries.length, loaded: 0, ready: false };
       });
 
-      numericYears.forEach((yearStr) => {
-        const groupEl = document.createElement("section");
-        groupEl.className = "timeline-year-group";
-        groupEl.id = yearStr;
-
-        const heading = document.createElement("h2");
-        heading.className = "timeline-year-heading";
-        heading.textContent = yearStr;
-        groupEl.appendChild(heading);
-
-        const gridEl = document.createElement("div");
-        gridEl.className = "timeline-year-grid";
-
-        const entries = yearMap.get(yearStr) || [];
-        entries.forEach(({ item, index }) => {
-          const itemEl = document.createElement("article");
-          itemEl.className = "timeline-item";
-          itemEl.dataset.eventIndex = index.toString();
-          itemEl.dataset.year = yearStr;
-
-          if (item.text && item.text.trim().length > 0) itemEl.classList.add("timeline-item-full");
-
-          const cardEl = document.createElement("div");
-          cardEl.className = "timeline-card";
-
-          const topLink = document.createElement("a");
-          topLink.className = "back-to-top";
-          topLink.textContent = "Top";
-          topLink.href = "#page-top";
-          cardEl.appendChild(topLink);
-
-          const headerEl = document.createElement("div");
-          headerEl.className = "timeline-header";
-
-          const dateEl = document.createElement("span");
-          dateEl.className = "timeline-date";
-          dateEl.textContent = item.date_label || "";
-          headerEl.appendChild(dateEl);
-
-          if (item.file_label) {
-            const fileEl = document.createElement("span");
-            fileEl.className = "timeline-file";
-            fileEl.textContent = item.file_label;
-            headerEl.appendChild(fileEl);
-          }
-
-          cardEl.appendChild(headerEl);
-
-          const imgWrapper = document.createElement("div");
-          imgWrapper.className = "timeline-image-wrapper";
-
-          const picture = document.createElement("picture");
-          const img = document.createElement("img");
-          img.src = item.image;  // thumbnail
-          img.alt = item.title || "Archive photo";
-          img.decoding = "async";
-
-          img.addEventListener("load", () => markYearImageLoaded(yearStr));
-          img.addEventListener("error", () => markYearImageLoaded(yearStr));
-
-          img.addEventListener("click", () => {
-            const fullSrc = item.full_image || item.image;
-            const jxlSrc = item.jxl_image || null;
-            openFullscreen(fullSrc, item.title || item.file_label || "Archive photo", jxlSrc);
-          });
-
-          picture.appendChild(img);
-          imgWrapper.appendChild(picture);
-          cardEl.appendChild(imgWrapper);
-
-          if (item.text && item.text.trim().length > 0) {
-            const textBox = document.createElement("div");
-            textBox.className = "timeline-textbox";
-            textBox.textContent = item.text;
-            cardEl.appendChild(textBox);
-          }
-
-          itemEl.appendChild(cardEl);
-          gridEl.appendChild(itemEl);
-        });
-
-        groupEl.appendChild(gridEl);
-        container.appendChild(groupEl);
-      });
-
-      if (hasUnknown) {
-        const entries = yearMap.get(UNKNOWN_KEY) || [];
-        if (entries.length > 0) {
-          const groupEl = document.createElement("section");
-          groupEl.className = "timeline-year-group";
-
-          const heading = document.createElement("h2");
-          heading.className = "timeline-year-heading";
-          heading.textContent = "Unknown Date";
-          groupEl.appendChild(heading);
-
-          const gridEl = document.createElement("div");
-          gridEl.className = "timeline-year-grid";
-
-          entries.forEach(({ item, index }) => {
-            const itemEl = document.createElement("article");
-            itemEl.className = "timeline-item";
-            itemEl.dataset.eventIndex = index.toString();
-            if (item.text && item.text.trim().length > 0) itemEl.classList.add("timeline-item-full");
-
-            const cardEl = document.createElement("div");
-            cardEl.className = "timeline-card";
-
-            const topLink = document.createElement("a");
-            topLink.className = "back-to-top";
-            topLink.textContent = "Top";
-            topLink.href = "#page-top";
-            cardEl.appendChild(topLink);
-
-            const headerEl = document.createElement("div");
-            headerEl.className = "timeline-header";
-
-            const dateEl = document.createElement("span");
-            dateEl.className = "timeline-date";
-            dateEl.textContent = item.date_label || "";
-            headerEl.appendChild(dateEl);
-
-            if (item.file_label) {
-              const fileEl = document.createElement("span");
-              fileEl.className = "timeline-file";
-              fileEl.textContent = item.file_label;
-              headerEl.appendChild(fileEl);
-            }
-
-            cardEl.appendChild(headerEl);
-
-            const imgWrapper = document.createElement("div");
-            imgWrapper.className = "timeline-image-wrapper";
-
-            const picture = document.createElement("picture");
-            const img = document.createElement("img");
-            img.src = item.image;
-            img.alt = item.title || "Archive photo";
-            img.decoding = "async";
-
-            img.addEventListener("click", () => {
-              const fullSrc = item.full_image || item.image;
-              const jxlSrc = item.jxl_image || null;
-              openFullscreen(fullSrc, item.title || item.file_label || "Archive photo", jxlSrc);
-            });
-
-            picture.appendChild(img);
-            imgWrapper.appendChild(picture);
-            cardEl.appendChild(imgWrapper);
-
-            if (item.text && item.text.trim().length > 0) {
-              const textBox = document.createElement("div");
-              textBox.className = "timeline-textbox";
-              textBox.textContent = item.text;
-              cardEl.appendChild(textBox);
-            }
-
-            itemEl.appendChild(cardEl);
-            gridEl.appendChild(itemEl);
-          });
-
-          groupEl.appendChild(gridEl);
-          container.appendChild(groupEl);
+      // [headingText, id, entries, yearStr] per group, Unknown Date last
+      const groups = numericYears.map((yearStr) => [yearStr, yearStr, yearMap.get(yearStr) || [], yearStr]);
+      const unknownEntries = yearMap.get(UNKNOWN_KEY) || [];
+      if (unknownEntries.length > 0) groups.push(["Unknown Date", null, unknownEntries, null]);
+
+      const cardTpl = makeCardTemplate();
+      let i = 0;
+      while (i < groups.length) {
+        // Each slice is built off-DOM and inserted with a single append
+        const frag = document.createDocumentFragment();
+        const sliceStart = performance.now();
+        do {
+          const [headingText, groupId, entries, yearStr] = groups[i++];
+          frag.appendChild(makeYearGroup(cardTpl, headingText, groupId, entries, yearStr));
+        } while (i < groups.length && performance.now() - sliceStart < FRAME_BUDGET_MS);
+        container.appendChild(frag);
+
+        if (i < groups.length) {
+          await new Promise((resolve) => requestAnimationFrame(resolve));
+          if (generation !== renderGeneration) return;
         }
       }
     }
 
     function renderTimelineNav(events) {
       const nav = document.getElementById("timeline-nav");
-      nav.innerHTML = "";
-
-      const yearSet = new Set();
-      events.forEach((item) => { if (item.year != null) yearSet.add(item.year); });
-      const years = Array.from(yearSet).map(Number).sort((a, b) => a - b);
+      nav.replaceChildren();
+
+      // events arrive sorted by year (see collect_events), so one pass dedupes them
+      const years = [];
+      let prev = null;
+      for (const item of events) {
+        const y = item.year;
+        if (y != null && y !== prev) { years.push(y); prev = y; }
+      }
 
+      const frag = document.createDocumentFragment();
+      const pillTpl = document.createElement("a");
+      pillTpl.className = "nav-pill nav-pill-disabled";
       years.forEach((year) => {
         const yearStr = String(year);
-        const link = document.createElement("a");
-        link.className = "nav-pill nav-pill-disabled";
+        const link = pillTpl.cloneNode(false);
         link.textContent = yearStr;
         link.href = "#" + yearStr;
         link.dataset.year = yearStr;
-        nav.appendChild(link);
+        frag.appendChild(link);
       });
+      nav.appendChild(frag);
     }
 
     // ---------- Accessibility settings ----------
-    function applyA11ySettings(settings) {
+    let lastA11ySig = null;  // what applyA11ySettings last wrote to the page
+
+    function applyA11ySettings(settings, refs = a11yRefs) {
       const scale = Math.min(1.8, Math.max(0.85, settings.scale || 1));
-      document.documentElement.style.setProperty("--a11y-font-scale", String(scale));
+      const mode = settings.font || "default";
+      // Clamped scale hits its bounds, so repeated +/- often changes nothing
+      const sig = scale + "|" + mode + "|" + !!settings.contrast + "|" + !!settings.light + "|" + !!settings.invert_images;
+      if (sig === lastA11ySig) return;
+      lastA11ySig = sig;
+
+      const root = document.documentElement;
+      root.style.setProperty("--a11y-font-scale", String(scale));
 
       // Mutually-exclusive theme modes
       document.body.classList.remove("theme-dark", "theme-light", "high-contrast");
@@ -1045,41 +1238,13 @@ __FONT_FACE_CSS__
         document.body.classList.add(settings.light ? "theme-light" : "theme-dark");
       }
 
-      // Invert images (independent)
-      document.documentElement.style.setProperty("--invert-images", settings.invert_images ? "1" : "0");
-
-      // Typeface (some require local font files to actually load)
-      const setFont = (stack) => {
-        document.documentElement.style.setProperty("--a11y-font-body", stack);
-        document.documentElement.style.setProperty("--a11y-font-ui", stack);
-      };
-
-      const mode = settings.font || "default";
-      if (mode === "atkinson") {
-        setFont('"Atkinson Hyperlegible", Arial, sans-serif');
-      } else if (mode === "arial") {
-        setFont('Arial, Helvetica, sans-serif');
-      } else if (mode === "tahoma") {
-        setFont('Tahoma, Arial, sans-serif');
-      } else if (mode === "trebuchet") {
-        setFont('"Trebuchet MS", Arial, sans-serif');
-      } else if (mode === "times") {
-        setFont('"Times New Roman", Times, serif');
-      } else if (mode === "lexend") {
-        setFont('"Lexend", Arial, sans-serif');
-      } else if (mode === "opendyslexic") {
-        setFont('"OpenDyslexic", Arial, sans-serif');
-      } else {
-        // Default split
-        document.documentElement.style.setProperty("--a11y-font-body", '"Georgia", "Times New Roman", serif');
-        document.documentElement.style.setProperty("--a11y-font-ui", '"Courier New", monospace');
-      }
+      // Invert images (independent) and typeface: the stacks live in the html[data-*] CSS rules
+      // (some fonts require local font files to actually load)
+      root.dataset.invert = settings.invert_images ? "1" : "0";
+      root.dataset.font = mode;
 
       // UI state
-      const contrastBtn = document.getElementById("a11y-contrast");
-      const themeBtn = document.getElementById("a11y-theme");
-      const invertBtn = document.getElementById("a11y-invert");
-      const fontSelect = document.getElementById("a11y-font");
+      const { contrastBtn, themeBtn, invertBtn, fontSelect } = refs;
 
       if (contrastBtn) contrastBtn.setAttribute("aria-pressed", settings.contrast ? "true" : "false");
       if (themeBtn) themeBtn.setAttribute("aria-pressed", settings.light ? "true" : "false");
@@ -1091,24 +1256,49 @@ __FONT_FACE_CSS__
       if (themeBtn) themeBtn.disabled = !!settings.contrast;
     }
 
+    const A11Y_DEFAULTS = Object.freeze({ scale: 1, light: false, contrast: false, font: "default", invert_images: false });
+
+    // Always returns a fresh object: the click handlers mutate it in place
     function loadA11ySettings() {
       try {
         const raw = localStorage.getItem("a11y_settings");
-        if (!raw) return { scale: 1, light: false, contrast: false, font: "default", invert_images: false };
-        const parsed = JSON.parse(raw);
-        return Object.assign({ scale: 1, light: false, contrast: false, font: "default", invert_images: false }, parsed);
+        if (!raw) return { ...A11Y_DEFAULTS };
+        return Object.assign({}, A11Y_DEFAULTS, JSON.parse(raw));
       } catch {
-        return { scale: 1, light: false, contrast: false, font: "default", invert_images: false };
+        return { ...A11Y_DEFAULTS };
       }
     }
 
-    function saveA11ySettings(settings) {
-      try { localStorage.setItem("a11y_settings", JSON.stringify(settings)); } catch {}
-    }
+    // Coalesce bursts (e.g. hammering A+) into one localStorage write; flush on pagehide
+    const saveA11ySettings = (() => {
+      let pending = null;
+      let timer = 0;
+      const flush = () => {
+        clearTimeout(timer);
+        timer = 0;
+        if (!pending) return;
+        try { localStorage.setItem("a11y_settings", JSON.stringify(pending)); } catch {}
+        pending = null;
+      };
+      window.addEventListener("pagehide", flush);
+      return (settings) => {
+        pending = settings;
+        if (!timer) timer = setTimeout(flush, 250);
+      };
+    })();
 
-    document.addEventListener("DOMContentLoaded", () => {
+    document.addEventListener("DOMContentLoaded", async () => {
       fullscreenOverlay = document.getElementById("fullscreen-overlay");
       fullscreenImage = document.getElementById("fullscreen-image");
+      fullscreenSource = document.getElementById("fullscreen-source-jxl");
+      a11yRefs = {
+        incBtn: document.getElementById("a11y-text-inc"),
+        decBtn: document.getElementById("a11y-text-dec"),
+        contrastBtn: document.getElementById("a11y-contrast"),
+        themeBtn: document.getElementById("a11y-theme"),
+        fontSelect: document.getElementById("a11y-font"),
+        invertBtn: document.getElementById("a11y-invert"),
+      };
 
       if (fullscreenOverlay) fullscreenOverlay.addEventListener("click", () => closeFullscreen());
       document.addEventListener("keydown", (e) => { if (e.key === "Escape") closeFullscreen(); });
@@ -1116,12 +1306,7 @@ __FONT_FACE_CSS__
       let a11y = loadA11ySettings();
       applyA11ySettings(a11y);
 
-      const incBtn = document.getElementById("a11y-text-inc");
-      const decBtn = document.getElementById("a11y-text-dec");
-      const contrastBtn = document.getElementById("a11y-contrast");
-      const themeBtn = document.getElementById("a11y-theme");
-      const fontSelect = document.getElementById("a11y-font");
-      const invertBtn = document.getElementById("a11y-invert");
+      const { incBtn, decBtn, contrastBtn, themeBtn, fontSelect, invertBtn } = a11yRefs;
 
       if (incBtn) incBtn.addEventListener("click", () => {
         a11y.scale = Math.min(1.8, (a11y.scale || 1) + 0.1);
@@ -1154,8 +1339,19 @@ __FONT_FACE_CSS__
         applyA11ySettings(a11y); saveA11ySettings(a11y);
       });
 
-      renderTimeline(events);
+      // One delegated listener opens any card image; the data rides on the img itself
+      const timelineEl = document.getElementById("timeline");
+      if (timelineEl) timelineEl.addEventListener("click", (e) => {
+        const img = e.target;
+        if (img.tagName !== "IMG" || !img.classList.contains("timeline-img")) return;
+        openFullscreen(img.dataset.full, img.alt, img.dataset.jxl || null);
+      });
+
+      events = await eventsReady;
+
+      // Pills first: renderTimeline is chunked and its thumbnails unlock them as they load
       renderTimelineNav(events);
+      renderTimeline(events);
 
       if (events.length > 0) showIntroOverlay();
     });
@@ -1163,15 +1359,58 @@ __FONT_FACE_CSS__
 </body>
 </html>
 """
-    html = html_template.replace("__EVENTS_JSON__", events_json)
-    html = html.replace("__FONT_FACE_CSS__", font_face_css if font_face_css.strip() else "/* (no local fonts found in ./fonts/) */")
-    return html
+
+# Split once at import; build_html streams the pieces without any replace() copies
+_PRE, _REST = HTML_TEMPLATE.split("__FONT_FACE_CSS__")
+_MID, _POST = _REST.split("__EVENTS_JSON__")
+
+
+def build_html(events, out_path: Path) -> None:
+    font_face_css = font_face_css_if_present()
+    # Encode each event once; the total size decides how the array is embedded
+    ev_jsons = [json.dumps(ev, ensure_ascii=False, separators=JSON_SEPARATORS) for ev in events]
+    json_size = sum(map(len, ev_jsons)) + len(ev_jsons) + 1
+    with out_path.open("w", encoding="utf-8") as f:
+        f.write(_PRE)
+        f.write(font_face_css if font_face_css.strip() else "/* (no local fonts found in ./fonts/) */")
+        f.write(_MID)
+        if json_size > EVENTS_GZIP_THRESHOLD:
+            # Large archive: {"gzip": base64}, inflated in the page with DecompressionStream
+            gz = zlib.compressobj(9, zlib.DEFLATED, 31)  # wbits=31 writes a gzip container
+            chunks = [gz.compress(b"[")]
+            for i, ev_json in enumerate(ev_jsons):
+                chunks.append(gz.compress(("," if i else "").encode() + ev_json.encode("utf-8")))
+            chunks += [gz.compress(b"]"), gz.flush()]
+            f.write('{"gzip":"')
+            f.write(base64.b64encode(b"".join(chunks)).decode("ascii"))
+            f.write('"}')
+        else:
+            # The events array as a JS string, written event by event without
+            # joining; escaping "<" keeps "</script>" out of the page
+            f.write('"[')
+            for i, ev_json in enumerate(ev_jsons):
+                if i:
+                    f.write(",")
+                f.write(json.dumps(ev_json, ensure_ascii=False)[1:-1].replace("<", "\\u003c"))
+            f.write(']"')
+        f.write(_POST)
+
+
+def write_precompressed(path: Path) -> None:
+    """
+    Write .gz (and .br if brotli is installed) next to `path`, so a static
+    server can send them as-is instead of compressing on every request.
+    """
+    with path.open("rb") as src, gzip.open(f"{path}.gz", "wb", compresslevel=9) as dst:
+        shutil.copyfileobj(src, dst)
+    if brotli is not None:
+        Path(f"{path}.br").write_bytes(brotli.compress(path.read_bytes(), quality=11))
 
 
 def main():
     events = collect_events()
-    html = build_html(events)
-    OUTPUT_HTML.write_text(html, encoding="utf-8")
+    build_html(events, OUTPUT_HTML)
+    write_precompressed(OUTPUT_HTML)
     print(f"Generated {OUTPUT_HTML} with {len(events)} events.")
     print(f"Thumbnails in: {THUMBS_DIR}")
     print("Optional fonts: put .woff2 files in ./fonts/ (see script comments)")